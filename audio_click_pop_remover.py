@@ -8,14 +8,486 @@ and cubic interpolation. Preserves music quality while removing transient artifa
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+import os
+import multiprocessing
+import queue
 import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import uuid
 import traceback
 import numpy as np
 import soundfile as sf
-from scipy import signal
-from scipy.interpolate import interp1d
+from scipy.ndimage import median_filter, uniform_filter1d
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to the NumPy implementation
+    njit = None
+
+try:
+    import cupy as cp
+    from cupyx.scipy.ndimage import median_filter as cupy_median_filter
+except Exception:  # CuPy is optional
+    cp = None
+
+
+# Length of the blocks audio is streamed through, in seconds
+BLOCK_SECONDS = 10
+
+# Samples either side of a click used to interpolate over it
+INTERPOLATION_CONTEXT = 5
+
+# Blocks smaller than this (samples x channels) aren't worth the GPU transfer
+GPU_MIN_SAMPLES = 500_000
+
+# Samples averaged to set the local threshold of the gradient detector
+GRADIENT_AVERAGE_LENGTH = 1000
+
+# Sensitivity (threshold multiplier) the gradient detector's threshold is tuned for
+GRADIENT_REFERENCE_THRESHOLD = 4.0
+
+# Clicks up to this many samples long are repaired with linear interpolation
+SHORT_CLICK_LENGTH = 3
+
+
+def _group_clicks_numpy(difference: np.ndarray, threshold_value: float,
+                        max_length: int) -> List[tuple]:
+    """Group samples of difference above threshold_value into (start, end) runs."""
+    outliers = difference > threshold_value
+
+    # Rising/falling edges of the padded mask mark the start/end of each run
+    edges = np.diff(np.concatenate(([0], outliers.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    # Runs longer than max_length are probably not clicks
+    keep = (ends - starts) <= max_length
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _group_clicks(difference, threshold_value, max_length):
+        """Threshold and group difference in a single pass (compiled with numba)."""
+        clicks = []
+        run_start = -1
+        for i in range(difference.size):
+            if difference[i] > threshold_value:
+                if run_start < 0:
+                    run_start = i
+            elif run_start >= 0:
+                if i - run_start <= max_length:
+                    clicks.append((run_start, i))
+                run_start = -1
+
+        # Handle click extending to end of file
+        if run_start >= 0 and difference.size - run_start <= max_length:
+            clicks.append((run_start, difference.size))
+        return clicks
+
+    @njit(cache=True)
+    def _median_filter_columns(audio, window_size):
+        """
+        Median filter each column of audio along axis 0 with reflect padding.
+
+        Keeps the current window sorted and slides it one sample at a time (drop the
+        outgoing sample, insert the incoming one), which costs O(window_size) per
+        sample and matches scipy.ndimage.median_filter exactly.
+        """
+        n, channels = audio.shape
+        half = window_size // 2
+        filtered = np.empty_like(audio)
+        window = np.empty(window_size, dtype=audio.dtype)
+        for ch in range(channels):
+            column = audio[:, ch]
+            for j in range(window_size):
+                k = j - half
+                if k < 0:
+                    k = -k - 1
+                elif k >= n:
+                    k = 2 * n - k - 1
+                window[j] = column[k]
+            window.sort()
+            filtered[0, ch] = window[half]
+
+            for i in range(1, n):
+                k_out = i - 1 - half
+                if k_out < 0:
+                    k_out = -k_out - 1
+                k_in = i + window_size - 1 - half
+                if k_in >= n:
+                    k_in = 2 * n - k_in - 1
+                outgoing = column[k_out]
+                incoming = column[k_in]
+
+                # Replace the outgoing sample and shift it into sorted position
+                p = 0
+                while p < window_size - 1 and window[p] != outgoing:
+                    p += 1
+                if incoming >= outgoing:
+                    while p + 1 < window_size and window[p + 1] < incoming:
+                        window[p] = window[p + 1]
+                        p += 1
+                else:
+                    while p > 0 and window[p - 1] > incoming:
+                        window[p] = window[p - 1]
+                        p -= 1
+                window[p] = incoming
+                filtered[i, ch] = window[half]
+        return filtered
+else:
+    _group_clicks = _group_clicks_numpy
+
+
+def _partition_median(values: np.ndarray, overwrite: bool = False) -> np.ndarray:
+    """
+    Median along axis 0 using a single O(n) partition.
+
+    Takes the upper middle element for even lengths instead of averaging the two
+    middle elements like np.median, which makes no difference for a threshold.
+    With overwrite=True values is partitioned in place instead of copied.
+    """
+    k = len(values) // 2
+    if overwrite:
+        values.partition(k, axis=0)
+        return values[k].copy()
+    return np.partition(values, k, axis=0)[k]
+
+
+@lru_cache(maxsize=None)
+def _gpu_available() -> bool:
+    """
+    Whether CuPy has a working CUDA device.
+
+    Probed on first use rather than at import, so CUDA is only initialised in the
+    worker process that filters on the GPU, never in the GUI process.
+    """
+    if cp is None:
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def _median_filter(audio: np.ndarray, window_size: int) -> np.ndarray:
+    """Median filter every channel along the time axis, reflecting at the edges."""
+    if audio.size >= GPU_MIN_SAMPLES and _gpu_available():
+        filtered = cupy_median_filter(cp.asarray(audio), size=(window_size, 1), mode='reflect')
+        return cp.asnumpy(filtered)
+    if njit is not None and len(audio) >= window_size:
+        return _median_filter_columns(audio, window_size)
+    return median_filter(audio, size=(window_size, 1), mode='reflect')
+
+
+def _pair_click_edges(outliers: np.ndarray, max_length: int) -> List[tuple]:
+    """
+    Group gradient spikes into (start, end) clicks.
+
+    A click shows up in the gradient as a spike where it starts and another just
+    past its last sample, with little in between when it is flat. Runs of spikes
+    separated by fewer than max_length samples are joined, so each click spans
+    from its rising edge up to (not including) its falling edge.
+    """
+    edges = np.diff(np.concatenate(([0], outliers.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not starts.size:
+        return []
+
+    # A gap short enough to be the inside of a click joins the runs either side
+    joined = starts[1:] - ends[:-1] < max_length
+    starts = starts[np.r_[True, ~joined]]
+    ends = ends[np.r_[~joined, True]] - 1
+
+    # A lone spike with no falling edge is a step, not a click
+    keep = (ends > starts) & (ends - starts <= max_length)
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+
+def _detect_clicks_gradient(audio: np.ndarray, threshold: float,
+                            max_length: int) -> List[List[tuple]]:
+    """
+    Detect clicks as spikes in the first-order difference of the signal.
+
+    Clicks are near-impulses, so |x[n] - x[n-1]| jumps well above its local average
+    at their edges. The threshold grows quadratically with that local average, which
+    keeps loud passages from triggering, and scales with the sensitivity setting like
+    the median detector's does. Only linear-time filters are involved, so this is
+    much faster than the median filter on long recordings.
+    """
+    gradient = np.abs(np.diff(audio, axis=0, prepend=audio[:1]))
+    local_average = uniform_filter1d(gradient, GRADIENT_AVERAGE_LENGTH, axis=0)
+    threshold_value = 8 * local_average * local_average + 2.4 * local_average + 0.024
+    threshold_value *= threshold / GRADIENT_REFERENCE_THRESHOLD
+
+    outliers = gradient > threshold_value
+    return [_pair_click_edges(outliers[:, ch], max_length)
+            for ch in range(audio.shape[1])]
+
+
+@dataclass(frozen=True)
+class DetectParams:
+    """
+    Click detection settings, read from the GUI once per run.
+
+    Plain values rather than Tk variables, so worker processes can receive them.
+    """
+    window_size: int
+    threshold: float
+    max_length: int
+    context: int = INTERPOLATION_CONTEXT
+    mode: str = "median"
+    # threshold * 1.4826, which makes MAD equal to std for normal dist
+    mad_scale: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'mad_scale', self.threshold * 1.4826)
+
+
+def detect_clicks(audio: np.ndarray, params: DetectParams) -> List[List[tuple]]:
+    """
+    Detect clicks and pops using median filter approach, or with a first-order
+    gradient detector when params.mode is "gradient".
+
+    Args:
+        audio: Audio signal array of shape (samples, channels)
+        params: Window size, threshold and maximum click length to detect with
+
+    Returns:
+        One list per channel of tuples (start_idx, end_idx) marking detected clicks
+    """
+    if params.mode == "gradient":
+        return _detect_clicks_gradient(audio, params.threshold, params.max_length)
+
+    # Apply median filter to get smoothed signal, filtering every channel in one
+    # call along the time axis only (reflect avoids zero-padding at the edges)
+    filtered = _median_filter(audio, params.window_size)
+
+    # Calculate difference between original and filtered, reusing the filtered buffer
+    difference = filtered
+    np.subtract(audio, filtered, out=difference)
+    np.abs(difference, out=difference)
+
+    # Calculate per-channel threshold using median absolute deviation (more robust than std)
+    median_diff = _partition_median(difference)
+    deviation = difference - median_diff
+    np.abs(deviation, out=deviation)
+    mad = _partition_median(deviation, overwrite=True)
+    threshold_value = median_diff + params.mad_scale * mad
+
+    # Find samples exceeding threshold and group them into clicks
+    return [_group_clicks(difference[:, ch], threshold_value[ch], params.max_length)
+            for ch in range(audio.shape[1])]
+
+
+@lru_cache(maxsize=None)
+def _cubic_fit_matrix(length: int, context: int) -> np.ndarray:
+    """
+    Matrix mapping the context samples either side of a click of the given
+    length to the least-squares cubic through them, evaluated inside the click.
+    """
+    known_positions = np.r_[-context:0, length:length + context]
+    fit = np.linalg.pinv(np.vander(known_positions, 4))
+    return (np.vander(np.arange(length), 4) @ fit).astype(np.float32)
+
+
+def interpolate_clicks(audio: np.ndarray, clicks: List[tuple],
+                       context: int = INTERPOLATION_CONTEXT) -> None:
+    """
+    Replace detected clicks with interpolated values, in place.
+
+    Args:
+        audio: Audio signal array (may be a view, e.g. one channel of a block)
+        clicks: List of (start_idx, end_idx) tuples
+        context: Samples either side of a click the repair is fitted to
+    """
+    if not clicks:
+        return
+
+    click_bounds = np.asarray(clicks, dtype=np.int64)
+    lengths = click_bounds[:, 1] - click_bounds[:, 0]
+    # Clicks touching the file edges have only one anchor, so they take the cubic path
+    is_short = ((lengths <= SHORT_CLICK_LENGTH) & (click_bounds[:, 0] > 0)
+                & (click_bounds[:, 1] < len(audio)))
+
+    # Short clicks (the bulk on a typical record) sound the same with linear and
+    # cubic repair, so fill all of them with a single np.interp call
+    if is_short.any():
+        starts = click_bounds[is_short, 0]
+        ends = click_bounds[is_short, 1]
+        short_lengths = lengths[is_short]
+
+        # Sample positions inside every short click
+        offsets = np.arange(short_lengths.sum()) - np.repeat(np.cumsum(short_lengths) - short_lengths,
+                                                              short_lengths)
+        x_interp = np.repeat(starts, short_lengths) + offsets
+
+        # The untouched samples either side of each click anchor the line
+        anchors = np.unique(np.concatenate((starts - 1, ends)))
+        audio[x_interp] = np.interp(x_interp, anchors, audio[anchors])
+
+    # Longer clicks get a least-squares cubic through the samples either side. With
+    # full context on both sides the fit is a fixed linear map for each click
+    # length, so clicks sharing a length are repaired with one matrix product.
+    long_bounds = click_bounds[~is_short]
+    long_lengths = lengths[~is_short]
+    has_context = (long_bounds[:, 0] >= context) & (long_bounds[:, 1] + context <= len(audio))
+    for length in np.unique(long_lengths[has_context]).tolist():
+        starts = long_bounds[has_context & (long_lengths == length), 0][:, np.newaxis]
+        known = audio[starts + np.r_[-context:0, length:length + context]]
+        audio[starts + np.arange(length)] = known @ _cubic_fit_matrix(length, context).T
+
+    for start, end in long_bounds[~has_context].tolist():
+        # Get surrounding context on each side
+        pre_start = max(0, start - context)
+        post_end = min(len(audio), end + context)
+
+        # Create interpolation points
+        # Use points before and after the click
+        x_points = np.r_[pre_start:start, end:post_end]
+        y_points = np.concatenate((audio[pre_start:start], audio[end:post_end]))
+
+        if len(x_points) < 2:
+            # Not enough points for interpolation, skip
+            continue
+
+        # Fit a cubic to the local context (lower order near the file edges).
+        # Positions are relative to the click start to keep the fit well conditioned.
+        x_interp = np.arange(start, end)
+        try:
+            coef = np.polyfit(x_points - start, y_points, min(3, len(x_points) - 1))
+            audio[start:end] = np.polyval(coef, x_interp - start)
+        except Exception:
+            # If cubic fails, fall back to linear
+            audio[start:end] = np.interp(x_interp, x_points, y_points)
+
+
+def _warm_up_kernels():
+    """
+    Compile the numba kernels before the first file is processed.
+
+    The compiled code is cached on disk, so worker processes load it instead of
+    compiling it again and the first file already runs at native speed.
+    """
+    if njit is None:
+        return
+    sample = np.zeros((64, 2), dtype=np.float32)
+    detect_clicks(sample, DetectParams(window_size=9, threshold=4.0, max_length=8))
+
+
+def _process_one(file_path: Path, output_dir: Path, output_ext: str,
+                 input_dir: Path, overwrite: bool, params: DetectParams) -> Tuple[bool, List[str]]:
+    """
+    Process a single audio file.
+
+    Runs in a worker process, so it takes plain values instead of Tk variables
+    and returns its log lines for the GUI to display.
+
+    Returns:
+        Tuple of (success, log_lines)
+    """
+    log_lines = []
+    log = log_lines.append
+    try:
+        log(f"\nProcessing: {file_path.name}")
+
+        # Determine output file
+        if output_ext == "original":
+            output_ext = file_path.suffix
+
+        if overwrite:
+            # Create temporary file
+            temp_name = f"{file_path.stem}_{uuid.uuid4().hex[:8]}_temp{output_ext}"
+            output_path = file_path.parent / temp_name
+        else:
+            # Preserve directory structure in output folder
+            try:
+                rel_path = file_path.parent.relative_to(input_dir)
+            except ValueError:
+                rel_path = Path(".")
+            output_subdir = output_dir / rel_path
+            output_subdir.mkdir(parents=True, exist_ok=True)
+            output_path = output_subdir / f"{file_path.stem}_declick{output_ext}"
+
+        # Use appropriate subtype based on output format
+        if output_ext.lower() in ('.flac', '.wav'):
+            subtype = 'PCM_24'
+        else:
+            # Let soundfile choose default subtype for other formats
+            subtype = None
+
+        with sf.SoundFile(file_path) as infile:
+            sample_rate = infile.samplerate
+            channels = infile.channels
+            total_frames = infile.frames
+
+            log(f"  Sample rate: {sample_rate} Hz")
+            log(f"  Channels: {'Stereo' if channels > 1 else 'Mono'}")
+            log(f"  Duration: {total_frames / sample_rate:.2f}s")
+
+            # Stream the file in overlapping blocks so memory use doesn't grow with
+            # its length. Each block carries `margin` samples of context on both
+            # sides; only the middle part, which the block edges can't affect, is
+            # written out.
+            filter_length = GRADIENT_AVERAGE_LENGTH if params.mode == "gradient" else params.window_size
+            margin = filter_length + params.max_length + params.context
+            blocksize = max(BLOCK_SECONDS * sample_rate, 4 * margin)
+            clicks_per_channel = [0] * channels
+
+            log(f"  Processing audio in {BLOCK_SECONDS}s blocks...")
+            with sf.SoundFile(output_path, 'w', samplerate=sample_rate, channels=channels,
+                              subtype=subtype) as outfile:
+                block_start = 0
+                for block in infile.blocks(blocksize=blocksize, overlap=2 * margin,
+                                           dtype='float32', always_2d=True):
+                    is_first = block_start == 0
+                    is_last = block_start + len(block) >= total_frames
+                    keep_from = 0 if is_first else margin
+                    keep_to = len(block) if is_last else len(block) - margin
+
+                    block_clicks = detect_clicks(block, params)
+                    for ch, clicks in enumerate(block_clicks):
+                        interpolate_clicks(block[:, ch], clicks, params.context)
+                        clicks_per_channel[ch] += sum(1 for start, _ in clicks
+                                                      if keep_from <= start < keep_to)
+
+                    outfile.write(block[keep_from:keep_to])
+                    block_start += len(block) - 2 * margin
+
+        if channels == 2:
+            log(f"    Detected {clicks_per_channel[0]} clicks (left), "
+                f"{clicks_per_channel[1]} clicks (right)")
+        else:
+            log(f"    Detected {sum(clicks_per_channel)} clicks")
+        total_clicks = sum(clicks_per_channel)
+
+        log(f"  Saved to: {output_path}")
+
+        # If overwriting, replace original file
+        if overwrite:
+            try:
+                file_path.unlink()
+                output_path.rename(file_path)
+                log(f"  Replaced original file")
+            except Exception as e:
+                log(f"  Error replacing original: {str(e)}")
+                if output_path.exists():
+                    output_path.unlink()
+
+        if total_clicks == 0:
+            log(f"  Completed! No clicks detected - file was clean.")
+        else:
+            log(f"  Completed! Removed {total_clicks} clicks/pops")
+        return True, log_lines
+
+    except Exception as e:
+        log(f"  Error processing file: {str(e)}")
+        log(f"  {traceback.format_exc()}")
+        return False, log_lines
 
 
 class AudioClickPopRemover:
@@ -37,10 +509,18 @@ class AudioClickPopRemover:
         self.window_size = tk.StringVar(value="9")
         self.threshold_multiplier = tk.StringVar(value="4.0")
         self.max_click_length = tk.StringVar(value="8")
+        self.detection_mode = tk.StringVar(value="median")
 
         self.processing = False
 
+        # Log messages are queued by any thread and flushed by the Tk thread
+        self._log_queue = queue.Queue()
+
         self.setup_ui()
+        self._drain_log_queue()
+
+        # Pay the one-off JIT compile while the user is still choosing settings
+        threading.Thread(target=_warm_up_kernels, daemon=True).start()
 
     def setup_ui(self):
         # Configure main window for grid
@@ -162,11 +642,18 @@ class AudioClickPopRemover:
         ttk.Label(detect_frame, text="(3-15, default: 8)",
                  font=('Arial', 8, 'italic')).grid(row=2, column=2, sticky=tk.W, padx=(5, 0), pady=(10, 0))
 
+        # Detection method
+        ttk.Label(detect_frame, text="Detection Method:").grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
+        ttk.Combobox(detect_frame, textvariable=self.detection_mode, values=["median", "gradient"],
+                     width=10, state='readonly').grid(row=3, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+        ttk.Label(detect_frame, text="(gradient: much faster, ignores window size)",
+                 font=('Arial', 8, 'italic')).grid(row=3, column=2, sticky=tk.W, padx=(5, 0), pady=(10, 0))
+
         # Info text
         info_text = ("Median filter detects sudden amplitude spikes. Lower threshold = more aggressive.\n"
                     "Test on a small section first to find optimal settings for your vinyl!")
         ttk.Label(detect_frame, text=info_text, font=('Arial', 9), justify=tk.LEFT,
-                 foreground='blue').grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
+                 foreground='blue').grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
 
         # Preset buttons
         preset_frame = ttk.LabelFrame(content, text="Quick Presets", padding="10")
@@ -244,248 +731,30 @@ class AudioClickPopRemover:
             self.output_folder.set(folder)
 
     def log(self, message):
-        self.progress_text.config(state='normal')
-        self.progress_text.insert(tk.END, message + "\n")
-        self.progress_text.see(tk.END)
-        self.progress_text.config(state='disabled')
-        self.root.update_idletasks()
-
-    def clear_log(self):
-        self.progress_text.config(state='normal')
-        self.progress_text.delete(1.0, tk.END)
-        self.progress_text.config(state='disabled')
-
-    def detect_clicks(self, audio: np.ndarray, sample_rate: int,
-                     window_size: int, threshold: float, max_length: int) -> List[tuple]:
-        """
-        Detect clicks and pops using median filter approach.
-
-        Args:
-            audio: Audio signal array
-            sample_rate: Sample rate in Hz
-            window_size: Window size for median filter (samples)
-            threshold: Number of standard deviations for detection
-            max_length: Maximum length of a click (samples)
+        self._log_queue.put(message)
 
-        Returns:
-            List of tuples (start_idx, end_idx) marking detected clicks
-        """
-        # Apply median filter to get smoothed signal
-        filtered = signal.medfilt(audio, kernel_size=window_size)
-
-        # Calculate difference between original and filtered
-        difference = np.abs(audio - filtered)
-
-        # Calculate threshold using median absolute deviation (more robust than std)
-        median_diff = np.median(difference)
-        mad = np.median(np.abs(difference - median_diff))
-        threshold_value = median_diff + threshold * mad * 1.4826  # 1.4826 makes MAD equal to std for normal dist
-
-        # Find samples exceeding threshold
-        outliers = difference > threshold_value
-
-        # Group consecutive outliers into clicks
-        clicks = []
-        in_click = False
-        click_start = 0
-
-        for i in range(len(outliers)):
-            if outliers[i] and not in_click:
-                # Start of a new click
-                in_click = True
-                click_start = i
-            elif not outliers[i] and in_click:
-                # End of click
-                click_length = i - click_start
-                if click_length <= max_length:
-                    clicks.append((click_start, i))
-                in_click = False
-            elif in_click and (i - click_start) > max_length:
-                # Click too long, probably not a click
-                in_click = False
-
-        # Handle click extending to end of file
-        if in_click:
-            click_length = len(outliers) - click_start
-            if click_length <= max_length:
-                clicks.append((click_start, len(outliers)))
-
-        return clicks
-
-    def interpolate_clicks(self, audio: np.ndarray, clicks: List[tuple]) -> np.ndarray:
-        """
-        Replace detected clicks with interpolated values.
-
-        Args:
-            audio: Audio signal array
-            clicks: List of (start_idx, end_idx) tuples
-
-        Returns:
-            Corrected audio signal
-        """
-        corrected = audio.copy()
-
-        for start, end in clicks:
-            # Get surrounding context (5 samples on each side)
-            context = 5
-            pre_start = max(0, start - context)
-            post_end = min(len(audio), end + context)
-
-            # Create interpolation points
-            # Use points before and after the click
-            x_points = list(range(pre_start, start)) + list(range(end, post_end))
-            y_points = list(audio[pre_start:start]) + list(audio[end:post_end])
-
-            if len(x_points) < 2:
-                # Not enough points for interpolation, skip
-                continue
-
-            # Create cubic interpolator
+    def _drain_log_queue(self):
+        """Flush queued log messages into the progress box in one widget update."""
+        messages = []
+        while len(messages) < 100:
             try:
-                interpolator = interp1d(x_points, y_points, kind='cubic',
-                                       fill_value='extrapolate')
-                # Interpolate the click region
-                x_interp = range(start, end)
-                corrected[start:end] = interpolator(x_interp)
-            except Exception:
-                # If cubic fails, fall back to linear
-                try:
-                    interpolator = interp1d(x_points, y_points, kind='linear',
-                                           fill_value='extrapolate')
-                    x_interp = range(start, end)
-                    corrected[start:end] = interpolator(x_interp)
-                except Exception:
-                    # If all else fails, skip this click
-                    continue
-
-        return corrected
-
-    def process_file(self, file_path: Path, output_dir: Path, output_ext: str):
-        """Process a single audio file."""
-        try:
-            self.log(f"\nProcessing: {file_path.name}")
+                messages.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
 
-            # Get parameters
-            try:
-                window_size = int(self.window_size.get())
-                threshold = float(self.threshold_multiplier.get())
-                max_length = int(self.max_click_length.get())
-            except ValueError:
-                self.log(f"  Error: Invalid parameter values")
-                return
-
-            # Validate parameters
-            if window_size < 3 or window_size > 25:
-                self.log(f"  Error: Window size must be between 3 and 25")
-                return
-            if window_size % 2 == 0:
-                window_size += 1  # Must be odd for median filter
-                self.log(f"  Adjusted window size to {window_size} (must be odd)")
+        if messages:
+            self.progress_text.config(state='normal')
+            self.progress_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.progress_text.see(tk.END)
+            self.progress_text.config(state='disabled')
 
-            # Load audio (use float32 to save memory)
-            self.log(f"  Loading audio file...")
-            try:
-                audio, sample_rate = sf.read(file_path, dtype='float32')
-            except (MemoryError, np._core._exceptions._ArrayMemoryError):
-                # File too large, try with memory mapping
-                self.log(f"  File is large, using memory-efficient processing...")
-                try:
-                    with sf.SoundFile(file_path) as f:
-                        sample_rate = f.samplerate
-                        # Read in chunks to avoid memory issues
-                        chunk_size = 10 * sample_rate  # 10 seconds at a time
-                        audio_chunks = []
-                        while True:
-                            chunk = f.read(chunk_size, dtype='float32')
-                            if len(chunk) == 0:
-                                break
-                            audio_chunks.append(chunk)
-                        audio = np.concatenate(audio_chunks, axis=0)
-                except Exception as e:
-                    self.log(f"  Error: Unable to load file even with chunked reading: {str(e)}")
-                    return
+        # Come back sooner if there is still a backlog
+        self.root.after(10 if len(messages) == 100 else 100, self._drain_log_queue)
 
-            # Get original shape
-            original_shape = audio.shape
-            is_stereo = len(original_shape) > 1 and original_shape[1] > 1
-
-            self.log(f"  Sample rate: {sample_rate} Hz")
-            self.log(f"  Channels: {'Stereo' if is_stereo else 'Mono'}")
-            self.log(f"  Duration: {len(audio) / sample_rate:.2f}s")
-
-            # Process each channel separately
-            if is_stereo:
-                self.log(f"  Processing left channel...")
-                clicks_left = self.detect_clicks(audio[:, 0], sample_rate,
-                                                window_size, threshold, max_length)
-                self.log(f"    Detected {len(clicks_left)} clicks")
-                audio[:, 0] = self.interpolate_clicks(audio[:, 0], clicks_left)
-
-                self.log(f"  Processing right channel...")
-                clicks_right = self.detect_clicks(audio[:, 1], sample_rate,
-                                                 window_size, threshold, max_length)
-                self.log(f"    Detected {len(clicks_right)} clicks")
-                audio[:, 1] = self.interpolate_clicks(audio[:, 1], clicks_right)
-
-                total_clicks = len(clicks_left) + len(clicks_right)
-            else:
-                self.log(f"  Detecting clicks...")
-                clicks = self.detect_clicks(audio, sample_rate,
-                                          window_size, threshold, max_length)
-                self.log(f"    Detected {len(clicks)} clicks")
-                audio = self.interpolate_clicks(audio, clicks)
-                total_clicks = len(clicks)
-
-            # Determine output file
-            if output_ext == "original":
-                output_ext = file_path.suffix
-
-            if self.overwrite_originals.get():
-                # Create temporary file
-                temp_name = f"{file_path.stem}_{uuid.uuid4().hex[:8]}_temp{output_ext}"
-                output_path = file_path.parent / temp_name
-            else:
-                # Preserve directory structure in output folder
-                try:
-                    rel_path = file_path.parent.relative_to(Path(self.input_folder.get()))
-                except ValueError:
-                    rel_path = Path(".")
-                output_subdir = output_dir / rel_path
-                output_subdir.mkdir(parents=True, exist_ok=True)
-                output_path = output_subdir / f"{file_path.stem}_declick{output_ext}"
-
-            # Save processed audio
-            self.log(f"  Saving cleaned audio...")
-            # Use appropriate subtype based on output format
-            if output_ext.lower() == '.flac':
-                sf.write(output_path, audio, sample_rate, subtype='PCM_24')
-            elif output_ext.lower() == '.wav':
-                sf.write(output_path, audio, sample_rate, subtype='PCM_24')
-            else:
-                # Let soundfile choose default subtype for other formats
-                sf.write(output_path, audio, sample_rate)
-
-            self.log(f"  Saved to: {output_path}")
-
-            # If overwriting, replace original file
-            if self.overwrite_originals.get():
-                try:
-                    file_path.unlink()
-                    output_path.rename(file_path)
-                    self.log(f"  Replaced original file")
-                except Exception as e:
-                    self.log(f"  Error replacing original: {str(e)}")
-                    if output_path.exists():
-                        output_path.unlink()
-
-            if total_clicks == 0:
-                self.log(f"  Completed! No clicks detected - file was clean.")
-            else:
-                self.log(f"  Completed! Removed {total_clicks} clicks/pops")
-
-        except Exception as e:
-            self.log(f"  Error processing file: {str(e)}")
-            self.log(f"  {traceback.format_exc()}")
+    def clear_log(self):
+        self.progress_text.config(state='normal')
+        self.progress_text.delete(1.0, tk.END)
+        self.progress_text.config(state='disabled')
 
     def process_files(self):
         """Main processing function."""
@@ -525,10 +794,35 @@ class AudioClickPopRemover:
             self.log(f"Found {len(files)} file(s) to process.\n")
             self.log("=" * 70)
 
-            # Process each file
-            for i, file_path in enumerate(files, 1):
-                self.log(f"\n[{i}/{len(files)}]")
-                self.process_file(file_path, output_dir, output_ext)
+            # Tk variables can't be read from worker processes, so snapshot them here
+            params = DetectParams(
+                window_size=int(self.window_size.get()),
+                threshold=float(self.threshold_multiplier.get()),
+                max_length=int(self.max_click_length.get()),
+                mode=self.detection_mode.get(),
+            )
+            overwrite = self.overwrite_originals.get()
+
+            # Files are independent, so process them in parallel across CPU cores.
+            # Workers are spawned, not forked: a fork would copy the warm-up thread's
+            # numba compiler lock in whatever state it is in, and could deadlock
+            max_workers = min(os.cpu_count() or 1, len(files))
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {
+                    executor.submit(_process_one, file_path, output_dir, output_ext,
+                                    input_dir, overwrite, params): file_path
+                    for file_path in files
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    self.log(f"\n[{i}/{len(files)}]")
+                    try:
+                        _, log_lines = future.result()
+                    except Exception as e:
+                        log_lines = [f"\nProcessing: {futures[future].name}",
+                                     f"  Error processing file: {str(e)}"]
+                    for line in log_lines:
+                        self.log(line)
 
             self.log("\n" + "=" * 70)
             self.log(f"\nProcessing complete! Processed {len(files)} file(s).")
@@ -566,6 +860,10 @@ class AudioClickPopRemover:
             messagebox.showerror("Error", "All detection parameters must be valid numbers.")
             return
 
+        if window_size < 3 or window_size > 25:
+            messagebox.showerror("Error", "Window size must be between 3 and 25.")
+            return
+
         self.processing = True
         self.process_button.config(state='disabled', text="Processing...")
         self.clear_log()
@@ -576,6 +874,7 @@ class AudioClickPopRemover:
 
 
 def main():
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = AudioClickPopRemover(root)
     root.mainloop()
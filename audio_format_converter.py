@@ -5,14 +5,94 @@ Converts audio files from various formats to a specified output format.
 Collects all files into a single output folder regardless of input folder structure.
 """
 
+import asyncio
+import collections
+import contextvars
+import json
+import math
+import os
+import queue
+import re
+import shutil
 import subprocess
+import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
 import threading
 import traceback
 
 
+# Most input files converted by a single ffmpeg process
+BATCH_SIZE = 32
+
+# Options for conversion commands: no stdin, banner or progress, and only errors
+# in the output. Measurement passes keep the info level their results are printed at.
+FFMPEG_QUIET_ARGS = ('-nostdin', '-hide_banner', '-loglevel', 'error', '-nostats')
+
+# Output options that copy the audio stream without re-encoding it
+STREAM_COPY_ARGS = ('-c:a', 'copy')
+
+# Container formats whose audio stream is probed, since it may already be in the
+# output codec (e.g. MP3 audio inside an MP4) and can then be copied out as-is
+PROBED_EXTENSIONS = ('.mp4', '.m4a', '.aac', '.wma')
+
+# CPU core the ffmpeg processes of the current conversion task are pinned to
+_ffmpeg_cpu = contextvars.ContextVar('_ffmpeg_cpu', default=None)
+
+
+@dataclass(frozen=True)
+class ConvertSettings:
+    """
+    Conversion settings, read from the GUI once per run.
+
+    The parts of the ffmpeg command that are the same for every file are
+    built here once instead of for each file.
+    """
+    ffmpeg: str
+    output_ext: str
+    codec_args: tuple
+    # ffprobe next to ffmpeg, None if it can't be found
+    ffprobe: Optional[str] = None
+    # Codec of the output format that can be stream-copied from other containers
+    copy_codec: Optional[str] = None
+    normalize: bool = False
+    target_db: float = -1.0
+    normalization_mode: str = "loudnorm"
+
+
+def map_input_args(index: int) -> tuple:
+    """
+    Output options that take an output's audio and tags from input `index`.
+
+    Single-file and batched commands both use them, so what ends up in an output
+    (no video or cover art, the input's own tags) doesn't depend on batching.
+    """
+    return ('-map', f'{index}:a:0', '-map_metadata', str(index))
+
+
+def iter_audio_files(root: Path, extensions: set, recursive: bool):
+    """
+    Yield the paths, as strings, of the files under root whose extension is in
+    `extensions`.
+
+    Walks the tree once with os.scandir, whatever the number of extensions,
+    and uses the cached directory entry types instead of a stat per file.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif (entry.is_file(follow_symlinks=False)
+                      and os.path.splitext(entry.name)[1].lower() in extensions):
+                    yield entry.path
+
+
 class AudioFormatConverter:
     def __init__(self, root):
         self.root = root
@@ -26,10 +106,17 @@ class AudioFormatConverter:
         self.output_format = tk.StringVar(value=".mp3")
         self.enable_normalization = tk.BooleanVar(value=False)
         self.normalization_level = tk.StringVar(value="-1.0")
+        self.normalization_mode = tk.StringVar(value="loudnorm")
         self.recursive = tk.BooleanVar(value=True)
         self.ffmpeg_path = tk.StringVar(value="ffmpeg")
+        self.parallel_jobs = tk.IntVar(value=os.cpu_count() or 1)
+        self.cpu_affinity = tk.BooleanVar(value=False)
 
         self.processing = False
+        # ffmpeg executables (path, mtime) that already passed the version check
+        self._ffmpeg_checked = set()
+        # Log messages are queued by any thread and flushed by the Tk thread
+        self._log_queue = queue.Queue()
 
         # Supported input formats with checkboxes
         self.format_vars = {
@@ -45,6 +132,7 @@ class AudioFormatConverter:
         }
 
         self.setup_ui()
+        self._drain_log_queue()
 
     def setup_ui(self):
         # Configure main window for grid
@@ -151,7 +239,8 @@ class AudioFormatConverter:
                                     values=output_formats, width=15, state='readonly')
         output_combo.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
 
-        ttk.Label(format_frame, text="(MP3: 320kbps, WAV: 24-bit)",
+        ttk.Label(format_frame, text="(MP3: 320kbps, WAV: 24-bit. Files already in this format are "
+                                     "copied without re-encoding unless normalizing)",
                  font=('Arial', 8, 'italic')).grid(row=1, column=0, columnspan=2,
                                                    sticky=tk.W, pady=(5, 0))
 
@@ -171,6 +260,14 @@ class AudioFormatConverter:
                  font=('Arial', 8, 'italic')).grid(
             row=1, column=2, sticky=tk.W, padx=(5, 0))
 
+        ttk.Label(norm_frame, text="Method:").grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        ttk.Combobox(norm_frame, textvariable=self.normalization_mode, values=["loudnorm", "peak"],
+                     width=12, state='readonly').grid(row=2, column=1, sticky=tk.W, padx=(10, 0),
+                                                      pady=(5, 0))
+        ttk.Label(norm_frame, text="(peak: only adjusts volume, much faster)",
+                 font=('Arial', 8, 'italic')).grid(
+            row=2, column=2, sticky=tk.W, padx=(5, 0), pady=(5, 0))
+
         # Additional options
         options_frame = ttk.LabelFrame(content, text="Additional Options", padding="10")
         options_frame.grid(row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 15))
@@ -185,6 +282,15 @@ class AudioFormatConverter:
         ttk.Label(options_frame, text="(Leave as 'ffmpeg' if it's in your PATH)",
                  font=('Arial', 8, 'italic')).grid(row=3, column=0, sticky=tk.W, pady=(2, 0))
 
+        ttk.Label(options_frame, text="Parallel jobs:").grid(row=1, column=1, sticky=tk.W,
+                                                              padx=(15, 0), pady=(10, 0))
+        ttk.Spinbox(options_frame, from_=1, to=64, textvariable=self.parallel_jobs, width=5).grid(
+            row=2, column=1, sticky=tk.W, padx=(15, 0), pady=(5, 0))
+
+        ttk.Checkbutton(options_frame, text="Pin each parallel job to its own CPU core (Linux)",
+                       variable=self.cpu_affinity).grid(row=4, column=0, columnspan=2,
+                                                        sticky=tk.W, pady=(10, 0))
+
         # Info label
         info_label = ttk.Label(content,
             text="Note: All converted files will be placed directly in the output folder,\n"
@@ -228,11 +334,25 @@ class AudioFormatConverter:
             self.output_folder.set(folder)
 
     def log(self, message):
-        self.progress_text.config(state='normal')
-        self.progress_text.insert(tk.END, message + "\n")
-        self.progress_text.see(tk.END)
-        self.progress_text.config(state='disabled')
-        self.root.update_idletasks()
+        self._log_queue.put(message)
+
+    def _drain_log_queue(self):
+        """Flush queued log messages into the progress box in one widget update."""
+        messages = []
+        while len(messages) < 100:
+            try:
+                messages.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if messages:
+            self.progress_text.config(state='normal')
+            self.progress_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.progress_text.see(tk.END)
+            self.progress_text.config(state='disabled')
+
+        # Come back sooner if there is still a backlog
+        self.root.after(10 if len(messages) == 100 else 100, self._drain_log_queue)
 
     def clear_log(self):
         self.progress_text.config(state='normal')
@@ -253,80 +373,313 @@ class AudioFormatConverter:
         """Get list of selected input formats."""
         return [fmt for fmt, var in self.format_vars.items() if var.get()]
 
+    def check_ffmpeg(self, ffmpeg: str) -> bool:
+        """
+        Check that ffmpeg can be run.
+
+        Looks the executable up on PATH first, and only runs `ffmpeg -version`
+        the first time a given executable is used.
+        """
+        resolved = shutil.which(ffmpeg)
+        if resolved is None:
+            return False
+
+        key = (resolved, os.path.getmtime(resolved))
+        if key not in self._ffmpeg_checked:
+            try:
+                subprocess.run([resolved, '-version'],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+            except Exception:
+                return False
+            self._ffmpeg_checked.add(key)
+        return True
+
     def get_output_codec(self, output_ext: str) -> list:
         """Get the appropriate ffmpeg codec settings for the output format."""
         if output_ext == '.mp3':
             return ['-acodec', 'libmp3lame', '-b:a', '320k']
         elif output_ext == '.wav':
-            return ['-acodec', 'pcm_s24le']  # 24-bit PCM
+            return ['-acodec', 'pcm_s24le', '-threads', '0']  # 24-bit PCM
         else:
             return ['-acodec', 'libmp3lame', '-b:a', '320k']  # Default to MP3
 
-    def convert_file(self, file_path: Path, output_dir: Path, output_ext: str):
-        """Convert a single audio file."""
-        try:
-            self.log(f"\nConverting: {file_path.name}")
+    def saved_message(self, output_path: str, output_args: tuple) -> str:
+        """Log line for a finished file, saying whether it was re-encoded."""
+        if output_args == STREAM_COPY_ARGS:
+            return f"  ✓ Stream-copied to: {os.path.basename(output_path)}"
+        return f"  ✓ Saved to: {os.path.basename(output_path)}"
+
+    def get_output_args(self, file_path: str, settings: ConvertSettings,
+                        audio_filter: str = None, codec: str = None) -> tuple:
+        """Get the ffmpeg options for one output file: audio filter and codec."""
+        # Copy audio that is already in the output format as-is rather than
+        # decoding and re-encoding it
+        if audio_filter is None:
+            if os.path.splitext(file_path)[1].lower() == settings.output_ext:
+                return STREAM_COPY_ARGS
+            if codec is not None and codec == settings.copy_codec:
+                return STREAM_COPY_ARGS
+        if audio_filter:
+            return ('-af', audio_filter, *settings.codec_args)
+        return settings.codec_args
+
+    async def measure_normalization(self, file_path: str, settings: ConvertSettings):
+        """
+        Analyse a file and return the filter that normalizes it, or None.
+
+        "peak" measures the maximum level with volumedetect and applies a fixed
+        gain. "loudnorm" runs loudnorm's measurement pass, so the conversion can
+        use its linear mode instead of the less accurate, slower one-pass mode.
+        """
+        target_db = settings.target_db
+        if settings.normalization_mode == "peak":
+            analysis = "volumedetect"
+        else:
+            analysis = f"loudnorm=I=-16:TP={target_db}:LRA=11:print_format=json"
+
+        cmd = [settings.ffmpeg, '-nostdin', '-hide_banner', '-nostats',
+               '-i', file_path, '-map', '0:a:0',
+               '-af', analysis, '-f', 'null', '-']
+        # Enough lines for loudnorm's JSON and volumedetect's histogram
+        returncode, output = await self.run_ffmpeg(cmd, tail_lines=50)
+        if returncode != 0:
+            return None
+
+        if analysis == "volumedetect":
+            match = re.search(rb"max_volume: (-?[\d.]+) dB", output)
+            if match is None:
+                return None
+            gain = target_db - float(match.group(1))
+            return f"volume={gain:.2f}dB"
 
-            # Create output path (all files go directly into output folder)
-            output_path = output_dir / f"{file_path.stem}{output_ext}"
+        try:
+            # ffmpeg may print more (e.g. the output summary) after the JSON
+            text = output.decode(errors='replace')
+            stats, _ = json.JSONDecoder().raw_decode(text, text.rindex('{'))
+            measured = [float(stats[key]) for key in
+                        ('input_i', 'input_tp', 'input_lra', 'input_thresh', 'target_offset')]
+        except (ValueError, KeyError):
+            return None
+        # Silent files measure as -inf, which linear mode can't use
+        if not all(math.isfinite(value) for value in measured):
+            return None
+        measured_i, measured_tp, measured_lra, measured_thresh, offset = measured
+        return (f"loudnorm=I=-16:TP={target_db}:LRA=11:measured_I={measured_i}:"
+                f"measured_TP={measured_tp}:measured_LRA={measured_lra}:"
+                f"measured_thresh={measured_thresh}:offset={offset}:linear=true")
+
+    async def probe_audio_codec(self, file_path: str, settings: ConvertSettings):
+        """Get the codec name of a file's first audio stream with ffprobe, or None."""
+        cmd = [settings.ffprobe, '-v', 'error', '-select_streams', 'a:0',
+               '-show_entries', 'stream=codec_name', '-of', 'csv=p=0', file_path]
+        returncode, output = await self.run_ffmpeg(cmd)
+        if returncode != 0:
+            return None
+        return output.decode(errors='replace').strip() or None
+
+    async def plan_batch(self, batch: list, settings: ConvertSettings) -> list:
+        """
+        Work out the ffmpeg output options for each file of a batch.
+
+        Files are measured first when normalizing, since the gain depends on the
+        file. Otherwise container formats are probed for audio that can be copied.
+        """
+        plans = []
+        for file_path, _ in batch:
+            audio_filter = None
+            codec = None
+            if settings.normalize:
+                audio_filter = await self.measure_normalization(file_path, settings)
+                if audio_filter is None:
+                    self.log(f"Warning: could not measure {os.path.basename(file_path)}, "
+                             f"converting without normalization")
+            elif (settings.ffprobe and settings.copy_codec
+                  and os.path.splitext(file_path)[1].lower() in PROBED_EXTENSIONS):
+                codec = await self.probe_audio_codec(file_path, settings)
+            plans.append(self.get_output_args(file_path, settings, audio_filter, codec))
+        return plans
+
+    async def run_ffmpeg(self, cmd: list, tail_lines: int = 10, capture: bool = True):
+        """
+        Run an ffmpeg command, returning its exit code and the last lines of its
+        combined output.
+
+        Output is read as it arrives and only the last `tail_lines` lines are
+        kept, so memory use doesn't grow with how much ffmpeg prints. Without
+        capture, output is discarded and no pipe is read at all.
+        """
+        cpu = _ffmpeg_cpu.get()
+        if cpu is not None:
+            cmd = ['taskset', '-c', str(cpu), *cmd]
+
+        if not capture:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL)
+            return await proc.wait(), b''
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT)
+        tail = collections.deque(maxlen=tail_lines)
+        partial = b''
+        while True:
+            chunk = await proc.stdout.read(65536)
+            if not chunk:
+                break
+            # ffmpeg ends its progress lines with \r, so split on both
+            lines = re.split(rb'[\r\n]', partial + chunk)
+            partial = lines.pop()
+            tail.extend(line for line in lines if line.strip())
+        if partial.strip():
+            tail.append(partial)
+        return await proc.wait(), b'\n'.join(tail)
+
+    def resolve_output_paths(self, files: list, output_dir: str, output_ext: str) -> list:
+        """
+        Pick the output path for every file before any conversion starts.
+
+        Names are chosen up front so files converting at the same time, or in the
+        same ffmpeg batch, can't claim the same name.
+
+        Returns:
+            List of (file_path, output_path) tuples
+        """
+        jobs = []
+        # List the output folder once and check names against it in memory,
+        # instead of a stat per candidate name. normcase makes the comparison
+        # case-insensitive where the filesystem is (Windows).
+        taken = {os.path.normcase(name) for name in os.listdir(output_dir)}
+        for file_path in files:
+            # All files go directly into output folder
+            file_name = os.path.basename(file_path)
+            stem = os.path.splitext(file_name)[0]
+            name = f"{stem}{output_ext}"
 
             # Handle duplicate filenames by adding a number
             counter = 1
-            original_output_path = output_path
-            while output_path.exists():
-                output_path = output_dir / f"{file_path.stem}_{counter}{output_ext}"
+            while os.path.normcase(name) in taken:
+                name = f"{stem}_{counter}{output_ext}"
                 counter += 1
 
             if counter > 1:
-                self.log(f"  File exists, saving as: {output_path.name}")
+                self.log(f"{file_name}: file exists, saving as: {name}")
+
+            taken.add(os.path.normcase(name))
+            jobs.append((file_path, os.path.join(output_dir, name)))
+        return jobs
+
+    async def convert_file(self, file_path: str, output_path: str, settings: ConvertSettings,
+                           output_args: tuple):
+        """
+        Convert a single audio file.
+
+        Several conversions run concurrently on one event loop. Log lines are
+        collected and written out together so their output doesn't interleave.
+        """
+        log_lines = []
+        log = log_lines.append
+        try:
+            log(f"\nConverting: {os.path.basename(file_path)}")
 
-            # Build ffmpeg command
-            ffmpeg = self.ffmpeg_path.get()
-            codec_settings = self.get_output_codec(output_ext)
+            # Construct command, adding output file with overwrite flag
+            cmd = [settings.ffmpeg, *FFMPEG_QUIET_ARGS, '-i', file_path,
+                   *map_input_args(0), *output_args, '-y', output_path]
 
-            # Build filter chain
-            filters = []
+            # Run ffmpeg. Its output is only needed if it fails, so it is
+            # discarded and the command rerun to capture the error if needed.
+            returncode, _ = await self.run_ffmpeg(cmd, capture=False)
+            if returncode != 0:
+                returncode, output = await self.run_ffmpeg(cmd)
 
-            # Add normalization if enabled
-            if self.enable_normalization.get():
-                try:
-                    target_db = float(self.normalization_level.get())
-                    filters.append(f"loudnorm=I=-16:TP={target_db}:LRA=11")
-                    self.log(f"  Normalizing to {target_db} dB")
-                except ValueError:
-                    self.log(f"  Warning: Invalid normalization level, skipping normalization")
+            if returncode == 0:
+                log(self.saved_message(output_path, output_args))
+            else:
+                log(f"  ✗ FFmpeg error:")
+                # Show last few lines of error
+                error_lines = output.decode(errors='replace').split('\n')
+                for line in error_lines:
+                    if line.strip():
+                        log(f"    {line}")
 
-            # Construct command
-            cmd = [
-                ffmpeg, '-i', str(file_path)
-            ]
+        except Exception as e:
+            log(f"  ✗ Error converting file: {str(e)}")
+            log(f"  {traceback.format_exc()}")
+        finally:
+            self.log("\n".join(log_lines))
 
-            # Add filters if any
-            if filters:
-                cmd.extend(['-af', ','.join(filters)])
+    async def convert_batch(self, batch: list, settings: ConvertSettings):
+        """
+        Convert several files with a single ffmpeg process.
 
-            # Add codec settings
-            cmd.extend(codec_settings)
+        Every file is an input of the same command and mapped to its own output,
+        which saves starting ffmpeg and its codecs once per file. If the batch
+        fails, its files are converted one at a time so the bad one is reported.
+        """
+        output_args = await self.plan_batch(batch, settings)
 
-            # Add output file with overwrite flag
-            cmd.extend(['-y', str(output_path)])
+        if len(batch) == 1:
+            await self.convert_file(*batch[0], settings, output_args[0])
+            return
 
-            # Run ffmpeg
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        try:
+            cmd = [settings.ffmpeg, *FFMPEG_QUIET_ARGS, '-y']
+            for file_path, _ in batch:
+                cmd.extend(['-i', file_path])
+            for i, ((_, output_path), args) in enumerate(zip(batch, output_args)):
+                cmd.extend([*map_input_args(i), *args, output_path])
+
+            returncode, _ = await self.run_ffmpeg(cmd, capture=False)
+        except Exception:
+            returncode = None
+
+        if returncode == 0:
+            self.log("\n".join(
+                f"\nConverting: {os.path.basename(file_path)}\n"
+                + self.saved_message(output_path, args)
+                for (file_path, output_path), args in zip(batch, output_args)))
+            return
 
-            if result.returncode == 0:
-                self.log(f"  ✓ Saved to: {output_path.name}")
-            else:
-                self.log(f"  ✗ FFmpeg error:")
-                # Show last few lines of error
-                error_lines = result.stdout.split('\n')[-10:]
-                for line in error_lines:
-                    if line.strip():
-                        self.log(f"    {line}")
+        self.log(f"\nBatch of {len(batch)} files failed, converting them one at a time")
+        for (file_path, output_path), args in zip(batch, output_args):
+            await self.convert_file(file_path, output_path, settings, args)
+
+    async def convert_all(self, jobs: list, settings: ConvertSettings, max_workers: int,
+                          pin_cpus: bool = False):
+        """
+        Convert files in batches, with at most `max_workers` ffmpeg processes at a time.
+
+        With pin_cpus, each running batch is pinned to its own CPU core with taskset.
+        With more workers than cores, the batches beyond one per core run unpinned.
+        """
+        # Give every worker a batch, with no batch over BATCH_SIZE, and spread the
+        # files evenly so that batch sizes differ by at most one file
+        batch_count = max(-(-len(jobs) // BATCH_SIZE), min(max_workers, len(jobs)))
+        batches = [jobs[len(jobs) * i // batch_count:len(jobs) * (i + 1) // batch_count]
+                   for i in range(batch_count)]
+
+        # Each running batch holds one slot, which is also the core it is pinned to.
+        # Slots past the last core are None, so no two batches share a pinned core
+        slots = asyncio.Queue()
+        cpu_count = os.cpu_count() or 1
+        for slot in range(max_workers):
+            slots.put_nowait(slot if slot < cpu_count else None)
+        done = 0
+
+        async def convert(batch):
+            nonlocal done
+            slot = await slots.get()
+            try:
+                # Every batch runs as its own task, so this only affects this batch
+                if pin_cpus:
+                    _ffmpeg_cpu.set(slot)
+                await self.convert_batch(batch, settings)
+            finally:
+                slots.put_nowait(slot)
+            done += len(batch)
+            self.log(f"[{done}/{len(jobs)}] done")
 
-        except Exception as e:
-            self.log(f"  ✗ Error converting file: {str(e)}")
-            self.log(f"  {traceback.format_exc()}")
+        await asyncio.gather(*(convert(batch) for batch in batches))
 
     def process_files(self):
         """Main processing function."""
@@ -351,10 +704,7 @@ class AudioFormatConverter:
                 return
 
             # Check ffmpeg
-            try:
-                subprocess.run([self.ffmpeg_path.get(), '-version'],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-            except Exception:
+            if not self.check_ffmpeg(self.ffmpeg_path.get()):
                 messagebox.showerror("Error",
                     "FFmpeg not found! Please install FFmpeg or specify the correct path.")
                 return
@@ -367,27 +717,51 @@ class AudioFormatConverter:
 
             # Find all audio files
             output_ext = self.output_format.get()
-            files = []
-
-            if self.recursive.get():
-                for ext in selected_formats:
-                    files.extend(list(input_dir.rglob(f"*{ext}")))
-            else:
-                for ext in selected_formats:
-                    files.extend(list(input_dir.glob(f"*{ext}")))
+            extensions = {ext.lower() for ext in selected_formats}
+            files = list(iter_audio_files(input_dir, extensions, self.recursive.get()))
 
             if not files:
                 messagebox.showinfo("Info", f"No audio files found in the input folder matching selected formats.")
                 return
 
+            # Tk variables are read here once, not for every file
+            normalize = self.enable_normalization.get()
+            ffmpeg = self.ffmpeg_path.get()
+            ffprobe = os.path.join(os.path.dirname(ffmpeg),
+                                   os.path.basename(ffmpeg).replace('ffmpeg', 'ffprobe'))
+            settings = ConvertSettings(
+                ffmpeg=ffmpeg,
+                output_ext=output_ext,
+                codec_args=tuple(self.get_output_codec(output_ext)),
+                ffprobe=shutil.which(ffprobe),
+                copy_codec='mp3' if output_ext == '.mp3' else None,
+                normalize=normalize,
+                target_db=float(self.normalization_level.get()) if normalize else -1.0,
+                normalization_mode=self.normalization_mode.get(),
+            )
+
+            # sys._is_gil_enabled only exists from Python 3.13
+            gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+            self.log(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
             self.log(f"Found {len(files)} audio file(s) to convert.")
             self.log(f"Output format: {output_ext}")
+            if settings.normalize:
+                self.log(f"Normalizing to {settings.target_db} dB ({settings.normalization_mode})")
             self.log("=" * 70)
 
-            # Process each file
-            for i, file_path in enumerate(files, 1):
-                self.log(f"\n[{i}/{len(files)}]")
-                self.convert_file(file_path, output_dir, output_ext)
+            jobs = self.resolve_output_paths(files, str(output_dir), output_ext)
+
+            # Conversions run as ffmpeg processes, several at once. One event loop
+            # waits on all of them and caps how many run.
+            max_workers = max(1, min(self.parallel_jobs.get(), len(files)))
+            self.log(f"Running {max_workers} conversion(s) in parallel")
+
+            pin_cpus = self.cpu_affinity.get() and max_workers > 1
+            if pin_cpus and not (sys.platform.startswith('linux') and shutil.which('taskset')):
+                self.log("CPU pinning needs Linux with taskset, running without it")
+                pin_cpus = False
+
+            asyncio.run(self.convert_all(jobs, settings, max_workers, pin_cpus))
 
             self.log("\n" + "=" * 70)
             self.log(f"\n✓ Conversion complete! Converted {len(files)} file(s).")
@@ -422,6 +796,13 @@ class AudioFormatConverter:
             messagebox.showerror("Error", "Normalization level must be a valid number.")
             return
 
+        try:
+            if self.parallel_jobs.get() < 1:
+                raise ValueError
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Error", "Parallel jobs must be a whole number of at least 1.")
+            return
+
         self.processing = True
         self.process_button.config(state='disabled', text="Converting...")
         self.clear_log()
@@ -5,17 +5,202 @@ Automatically detects and removes silence from the beginning and end of audio fi
 Uses RMS loudness analysis to find when actual music starts.
 """
 
+import io
+import math
+import os
+import queue
+import re
+import shutil
 import subprocess
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import uuid
 import traceback
 import numpy as np
 import soundfile as sf
 
+try:
+    import numpy_rms
+except ImportError:  # numpy-rms is optional - fall back to NumPy
+    numpy_rms = None
+
+# Most files trimmed by a single ffmpeg process
+BATCH_SIZE = 32
+
+# Analysis frames read from disk at a time while streaming a file
+STREAM_BLOCK_FRAMES = 20
+
+# FFmpeg silencedetect settings: level counted as silence and the shortest gap reported
+SILENCE_NOISE_DB = -40
+SILENCE_MIN_DURATION = 0.3  # seconds
+# Silence within this many seconds of either end of the file counts as touching it
+SILENCE_EDGE_TOLERANCE = 0.1
+
+# Matched against FFmpeg's raw stderr lines, so no decoding is needed
+SILENCE_MARKER_RE = re.compile(rb'silence_(start|end):\s*(-?[\d.]+)')
+DURATION_RE = re.compile(rb'Duration:\s*(\d+):(\d+):([\d.]+)')
+
+
+def _square_sum_dtype(x: np.ndarray):
+    """Accumulator for summing squares of x: int64 for integer samples, so they can't overflow."""
+    return np.int64 if x.dtype.kind == 'i' else None
+
+
+def _rms(x: np.ndarray) -> float:
+    """RMS of a 1-D array as a Python float, squaring and summing in one pass."""
+    return math.sqrt(float(np.einsum('i,i->', x, x, dtype=_square_sum_dtype(x))) / x.size)
+
+
+def downmix(block: np.ndarray) -> np.ndarray:
+    """
+    Average the channels of a 2-D (samples, channels) block into mono.
+
+    Channels are summed into one new buffer and scaled in place, rather than
+    going through np.mean's temporaries; mono input is returned as a view.
+    Integer samples are summed exactly in int32 and not divided by the channel
+    count, which the caller has to scale out.
+    """
+    channels = block.shape[1]
+    if channels == 1:
+        return block[:, 0]
+    integer = block.dtype.kind == 'i'
+    mono = np.add(block[:, 0], block[:, 1], dtype=np.int32 if integer else None)
+    for channel in range(2, channels):
+        mono += block[:, channel]
+    if not integer:
+        mono *= 1.0 / channels
+    return mono
+
+
+def frame_rms(audio: np.ndarray, start: int, count: int, frame_samples: int) -> np.ndarray:
+    """
+    RMS of `count` back-to-back frames of audio, the first starting at `start`.
+
+    A last frame cut short by the end of the audio is measured over the samples
+    it has, or left out if it is shorter than half a frame.
+    """
+    full_frames = min(count, (len(audio) - start) // frame_samples)
+    region = audio[start:start + full_frames * frame_samples]
+    if numpy_rms is not None and region.dtype == np.float32 and full_frames > 0:
+        # SIMD (AVX/NEON) kernel computing the RMS of each window
+        rms = numpy_rms.rms(np.ascontiguousarray(region), window_size=frame_samples)
+    else:
+        frames = region.reshape(full_frames, frame_samples)
+        # einsum squares and sums each frame in one pass, without a squared copy
+        rms = np.sqrt(np.einsum('ij,ij->i', frames, frames, dtype=_square_sum_dtype(frames))
+                      / frame_samples)
+
+    if full_frames < count:
+        tail = audio[start + full_frames * frame_samples:start + count * frame_samples]
+        if len(tail) >= frame_samples * 0.5:
+            # Appended in the series' own dtype; a bare Python float would widen it to float64
+            rms = np.append(rms, rms.dtype.type(_rms(tail)))
+    return rms
+
+
+def stream_rms(sound_file: sf.SoundFile,
+               frame_samples: int) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Stream a sound file from the start, downmixed to mono, and return the RMS of
+    back-to-back frames aligned to the start of the file, the RMS of back-to-back
+    frames aligned to its end, and the RMS of the whole file.
+
+    A last start-aligned frame cut short by the end of the file is measured over
+    the samples it has, or left out if it is shorter than half a frame; the
+    end-aligned frames are all whole and start `frames % frame_samples` samples in.
+    Only STREAM_BLOCK_FRAMES frames of audio are held in memory at a time.
+    """
+    total_samples = sound_file.frames
+    offset = total_samples % frame_samples
+    whole_frames = total_samples // frame_samples
+
+    # 16-bit PCM is decoded as integers, which skips libsndfile's conversion to float
+    # and halves the buffer. Those samples come back at full scale and with the
+    # channels summed rather than averaged, so the results are scaled down at the end
+    pcm16 = sound_file.subtype == 'PCM_16'
+    scale = 32768.0 * sound_file.channels if pcm16 else 1.0
+
+    # Every start-aligned frame is measured in two parts split `offset` samples in.
+    # A start-aligned frame is its head plus its tail, and an end-aligned frame is
+    # the tail of one plus the head of the next; the extra head is the short last frame
+    heads = np.zeros(whole_frames + 1)
+    tails = np.zeros(whole_frames)
+
+    # Every block is decoded into the same buffer, instead of allocating per block
+    buffer = np.empty((min(frame_samples * STREAM_BLOCK_FRAMES, total_samples), sound_file.channels),
+                      dtype=np.int16 if pcm16 else np.float32)
+    count = 0
+    for block in sound_file.blocks(out=buffer):
+        mono = downmix(block)
+        block_frames = len(mono) // frame_samples
+        frames = mono[:block_frames * frame_samples].reshape(block_frames, frame_samples)
+        head, tail = frames[:, :offset], frames[:, offset:]
+        # einsum squares and sums each part in one pass, without a squared copy
+        heads[count:count + block_frames] = np.einsum('ij,ij->i', head, head,
+                                                      dtype=_square_sum_dtype(head))
+        tails[count:count + block_frames] = np.einsum('ij,ij->i', tail, tail,
+                                                      dtype=_square_sum_dtype(tail))
+        count += block_frames
+
+        rest = mono[block_frames * frame_samples:]
+        if len(rest):
+            heads[count] = float(np.einsum('i,i->', rest, rest, dtype=_square_sum_dtype(rest)))
+
+    start_rms = np.sqrt((heads[:whole_frames] + tails) / frame_samples)
+    if offset >= frame_samples * 0.5:
+        start_rms = np.append(start_rms, math.sqrt(heads[whole_frames] / offset))
+    end_rms = np.sqrt((tails + heads[1:]) / frame_samples)
+    overall_rms = math.sqrt((heads.sum() + tails.sum()) / total_samples)
+
+    return ((start_rms / scale).astype(np.float32), (end_rms / scale).astype(np.float32),
+            overall_rms / scale)
+
+
+@dataclass(frozen=True)
+class TrimSettings:
+    """
+    Processing settings, read from the GUI once per run.
+
+    Worker threads use these instead of the Tk variables, so they never call into
+    Tk and a run isn't affected by settings changed while it is going.
+    """
+    ffmpeg: str
+    detection_method: str = "rms"
+    verbose: bool = False
+    overwrite: bool = False
+    normalize: bool = False
+    target_db: float = -1.0
+
+
+@dataclass(frozen=True)
+class TrimJob:
+    """A planned ffmpeg cut: the input and output files and the options for each."""
+    file_path: Path
+    output_path: Path
+    input_args: tuple
+    output_args: tuple
+
+
+def trim_command(ffmpeg: str, jobs: List[TrimJob]) -> list:
+    """
+    Build the ffmpeg command that makes the cuts of `jobs`, each input mapped to its own output.
+
+    Whether it cuts one file or a batch, every output gets only its input's first
+    audio stream and that input's tags, so the result doesn't depend on batching.
+    """
+    cmd = [ffmpeg, '-nostdin', '-y']
+    for job in jobs:
+        cmd.extend([*job.input_args, '-i', str(job.file_path)])
+    for i, job in enumerate(jobs):
+        cmd.extend(['-map', f'{i}:a:0', '-map_metadata', str(i),
+                    *job.output_args, str(job.output_path)])
+    return cmd
+
 
 class AudioSilenceTrimmer:
     def __init__(self, root):
@@ -33,11 +218,19 @@ class AudioSilenceTrimmer:
         self.normalization_level = tk.StringVar(value="-1.0")
         self.overwrite_originals = tk.BooleanVar(value=False)
         self.recursive = tk.BooleanVar(value=True)
+        self.verbose_logging = tk.BooleanVar(value=False)
         self.ffmpeg_path = tk.StringVar(value="ffmpeg")
+        self.detection_method = tk.StringVar(value="rms")
         
         self.processing = False
+
+        # Log messages are queued by any thread and flushed by the Tk thread;
+        # worker threads collect each file's messages so they stay together
+        self._log_queue = queue.Queue()
+        self._file_log = threading.local()
         
         self.setup_ui()
+        self._drain_log_queue()
         
     def setup_ui(self):
         # Configure main window for grid
@@ -138,11 +331,20 @@ class AudioSilenceTrimmer:
         info_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 15))
         row += 1
 
+        ttk.Radiobutton(info_frame, text="RMS loudness analysis", variable=self.detection_method,
+                        value="rms").grid(row=0, column=0, sticky=tk.W)
         info_text = ("Uses RMS loudness analysis to detect when actual music starts.\n"
                     "Analyzes audio in frames and compares to overall track loudness.\n"
                     "No manual settings needed - fully automatic!")
         ttk.Label(info_frame, text=info_text, font=('Arial', 9), justify=tk.LEFT).grid(
-            row=0, column=0, sticky=tk.W)
+            row=1, column=0, sticky=tk.W, padx=(20, 0))
+
+        ttk.Radiobutton(info_frame, text="FFmpeg silencedetect", variable=self.detection_method,
+                        value="ffmpeg").grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
+        ttk.Label(info_frame,
+                  text=f"Faster: treats audio below {SILENCE_NOISE_DB} dB as silence.",
+                  font=('Arial', 9), justify=tk.LEFT).grid(
+            row=3, column=0, sticky=tk.W, padx=(20, 0))
         
         # Normalization settings
         norm_frame = ttk.LabelFrame(content, text="Normalization (Optional)", padding="10")
@@ -167,12 +369,14 @@ class AudioSilenceTrimmer:
         
         ttk.Checkbutton(options_frame, text="Process subfolders recursively", 
                        variable=self.recursive).grid(row=0, column=0, sticky=tk.W)
+        ttk.Checkbutton(options_frame, text="Log every analysis frame (slower)",
+                       variable=self.verbose_logging).grid(row=1, column=0, sticky=tk.W)
         
-        ttk.Label(options_frame, text="FFmpeg Path:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
+        ttk.Label(options_frame, text="FFmpeg Path:").grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
         ttk.Entry(options_frame, textvariable=self.ffmpeg_path, width=50).grid(
-            row=2, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+            row=3, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         ttk.Label(options_frame, text="(Leave as 'ffmpeg' if it's in your PATH)", 
-                 font=('Arial', 8, 'italic')).grid(row=3, column=0, sticky=tk.W, pady=(2, 0))
+                 font=('Arial', 8, 'italic')).grid(row=4, column=0, sticky=tk.W, pady=(2, 0))
         
         # Progress section
         ttk.Label(content, text="Progress:", font=('Arial', 10, 'bold')).grid(
@@ -209,23 +413,41 @@ class AudioSilenceTrimmer:
             self.output_folder.set(folder)
     
     def log(self, message):
-        self.progress_text.config(state='normal')
-        self.progress_text.insert(tk.END, message + "\n")
-        self.progress_text.see(tk.END)
-        self.progress_text.config(state='disabled')
-        self.root.update_idletasks()
+        lines = getattr(self._file_log, 'lines', None)
+        if lines is not None:
+            lines.append(message)
+        else:
+            self._log_queue.put(message)
+
+    def _drain_log_queue(self):
+        """Flush queued log messages into the progress box in one widget update."""
+        messages = []
+        while len(messages) < 100:
+            try:
+                messages.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if messages:
+            self.progress_text.config(state='normal')
+            self.progress_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.progress_text.see(tk.END)
+            self.progress_text.config(state='disabled')
+
+        # Come back sooner if there is still a backlog
+        self.root.after(10 if len(messages) == 100 else 100, self._drain_log_queue)
     
     def clear_log(self):
         self.progress_text.config(state='normal')
         self.progress_text.delete(1.0, tk.END)
         self.progress_text.config(state='disabled')
     
-    def load_audio_with_ffmpeg(self, file_path: str) -> Tuple[Optional[np.ndarray], Optional[int]]:
-        """Load audio using FFmpeg for formats not supported by soundfile (like M4A/AAC)."""
+    def open_audio_with_ffmpeg(self, file_path: str, ffmpeg: str) -> Optional[sf.SoundFile]:
+        """Decode audio with FFmpeg for formats not supported by soundfile (like M4A/AAC)."""
         try:
             # Use FFmpeg to decode to raw PCM
             cmd = [
-                self.ffmpeg_path.get(), '-i', file_path,
+                ffmpeg, '-nostdin', '-i', file_path,
                 '-f', 's16le',  # 16-bit PCM
                 '-acodec', 'pcm_s16le',
                 '-ar', '44100',  # Standard sample rate
@@ -237,218 +459,240 @@ class AudioSilenceTrimmer:
 
             if result.returncode != 0:
                 self.log(f"  FFmpeg decode error: {result.stderr.decode()[:200]}")
-                return None, None
-
-            # Convert bytes to numpy array
-            audio = np.frombuffer(result.stdout, dtype=np.int16)
-            # Convert to float32 and normalize to [-1, 1]
-            audio = audio.astype(np.float32) / 32768.0
+                return None
 
-            return audio, 44100
+            # Wrap the decoded PCM so it can be streamed like any other sound file
+            return sf.SoundFile(io.BytesIO(result.stdout), format='RAW', subtype='PCM_16',
+                                endian='LITTLE', samplerate=44100, channels=2)
         except Exception as e:
             self.log(f"  Error loading with FFmpeg: {str(e)}")
-            return None, None
+            return None
+
+    def scan_frames(self, rms: np.ndarray, starts: range, overall_rms: float,
+                    threshold: float, sample_rate: int, verbose: bool = False) -> Optional[int]:
+        """
+        Scan frame RMS values, in the order given, for the first frame whose RMS
+        is within `threshold` of the overall track RMS.
+
+        `starts` holds the start sample of each frame, for logging with `verbose`.
+        Returns the index of the first matching frame, or None.
+        """
+        # Within `threshold` of the overall RMS is a fixed range of dB offsets from it,
+        # so one log10 per frame replaces the per-frame distance ratio division
+        overall_db = 20 * math.log10(overall_rms + 1e-10)
+        low_db = 20 * math.log10(1 - threshold) if threshold < 1 else -math.inf
+        high_db = 20 * math.log10(1 + threshold)
+
+        frame_db = 20 * np.log10(rms + 1e-10)
+        distance_db = frame_db - overall_db
+        close = (distance_db >= low_db) & (distance_db <= high_db)
+        found = int(np.argmax(close)) if close.any() else None
 
-    def detect_silence(self, file_path: str) -> Tuple[Optional[float], Optional[float], float]:
+        # Log the frames up to where the scan stopped, as a single message
+        scanned = len(rms) if found is None else found + 1
+        if verbose and scanned:
+            self.log("\n".join(
+                f"    Frame at {starts[k] / sample_rate:.2f}s: {frame_db[k]:.2f} dB "
+                f"(distance: {distance_db[k]:+.2f} dB)"
+                for k in range(scanned)))
+        return found
+
+    def detect_silence(self, file_path: str,
+                       settings: TrimSettings) -> Tuple[Optional[float], Optional[float], float]:
         """
         Detect when actual music starts and ends in an audio file using RMS loudness analysis.
         For vinyl rips, analyzes RMS loudness to find when sustained loud audio begins/ends.
+        The file is streamed rather than loaded whole, so memory use doesn't grow with its length.
         Returns: (start_time, end_time, total_duration)
         """
         try:
             self.log(f"  Loading audio file...")
 
-            # Load the audio file
-            audio = None
-            sample_rate = None
-
             try:
-                audio, sample_rate = sf.read(file_path, dtype='float32')
-            except (MemoryError, Exception) as mem_err:
-                error_str = str(mem_err).lower()
+                sound_file = sf.SoundFile(file_path)
+            except Exception as open_err:
+                error_str = str(open_err).lower()
 
                 # Check if it's a format not supported by soundfile
                 if 'format not recognised' in error_str or 'not supported' in error_str:
                     self.log(f"  Format not supported by soundfile, using FFmpeg...")
-                    audio, sample_rate = self.load_audio_with_ffmpeg(file_path)
-                    if audio is None:
+                    sound_file = self.open_audio_with_ffmpeg(file_path, settings.ffmpeg)
+                    if sound_file is None:
                         return None, None, 0
-                elif 'allocate' in error_str:
-                    # File too large, try chunked reading
-                    self.log(f"  File is large, using memory-efficient processing...")
-                    try:
-                        with sf.SoundFile(file_path) as f:
-                            sample_rate = f.samplerate
-                            # Read in chunks to avoid memory issues
-                            chunk_size = 10 * sample_rate  # 10 seconds at a time
-                            audio_chunks = []
-                            while True:
-                                chunk = f.read(chunk_size, dtype='float32')
-                                if len(chunk) == 0:
-                                    break
-                                audio_chunks.append(chunk)
-                            audio = np.concatenate(audio_chunks, axis=0)
-                    except Exception as chunk_err:
-                        # If chunked reading also fails, try FFmpeg
-                        if 'format not recognised' in str(chunk_err).lower():
-                            self.log(f"  Format not supported, using FFmpeg...")
-                            audio, sample_rate = self.load_audio_with_ffmpeg(file_path)
-                            if audio is None:
-                                return None, None, 0
-                        else:
-                            self.log(f"  Error: Unable to load file: {str(chunk_err)}")
-                            return None, None, 0
                 else:
                     raise  # Re-raise if unknown error
 
-            # Validate that audio was loaded successfully
-            if audio is None or sample_rate is None:
-                self.log(f"  Error: Failed to load audio file")
-                return None, None, 0
-
-            # Convert to mono if stereo
-            if len(audio.shape) > 1:
-                audio = np.mean(audio, axis=1)
-
-            total_length = len(audio) / sample_rate
-            self.log(f"  Duration: {total_length:.2f}s, Sample rate: {sample_rate}Hz")
-
-            # Calculate overall RMS loudness of the entire track
-            overall_rms = np.sqrt(np.mean(audio ** 2))
-            overall_db = 20 * np.log10(overall_rms + 1e-10)  # Add small value to avoid log(0)
-            self.log(f"  Overall track RMS: {overall_db:.2f} dB")
+            with sound_file:
+                sample_rate = sound_file.samplerate
+                total_samples = sound_file.frames
 
-            # Phase 1: Analyze in 0.5 second frames from the beginning
-            coarse_frame_size = 0.5  # seconds
-            coarse_samples = int(coarse_frame_size * sample_rate)
+                if total_samples == 0:
+                    self.log(f"  Error: File contains no audio")
+                    return None, None, 0
 
-            self.log(f"  Phase 1: Analyzing in {coarse_frame_size}s frames...")
+                def read_mono(start: int, length: int) -> np.ndarray:
+                    """Read `length` samples from `start`, downmixed to mono."""
+                    sound_file.seek(start)
+                    return downmix(sound_file.read(length, dtype='float32', always_2d=True))
 
-            # Threshold: consider a frame "close enough" to track RMS if within 50% of overall RMS
-            threshold_multiplier = 0.5
-            track_start_coarse = 0
+                total_length = total_samples / sample_rate
+                self.log(f"  Duration: {total_length:.2f}s, Sample rate: {sample_rate}Hz")
 
-            for i in range(0, len(audio), coarse_samples):
-                frame = audio[i:i + coarse_samples]
-                if len(frame) < coarse_samples * 0.5:  # Skip if frame is too small
-                    break
+                # Phase 1: Analyze in 0.5 second frames from the beginning
+                coarse_frame_size = 0.5  # seconds
+                coarse_samples = int(coarse_frame_size * sample_rate)
 
-                frame_rms = np.sqrt(np.mean(frame ** 2))
-                frame_db = 20 * np.log10(frame_rms + 1e-10)
+                # One streaming pass gives the overall RMS loudness of the entire track
+                # and the coarse RMS series for both the start and the end search
+                coarse_rms, end_coarse_rms, overall_rms = stream_rms(sound_file, coarse_samples)
+                overall_db = 20 * np.log10(overall_rms + 1e-10)  # Add small value to avoid log(0)
+                self.log(f"  Overall track RMS: {overall_db:.2f} dB")
 
-                # Calculate how close this frame is to the overall track RMS
-                distance_to_track = abs(frame_rms - overall_rms)
-                distance_ratio = distance_to_track / overall_rms
+                self.log(f"  Phase 1: Analyzing in {coarse_frame_size}s frames...")
 
-                time_pos = i / sample_rate
-                self.log(f"    Frame at {time_pos:.2f}s: {frame_db:.2f} dB (distance ratio: {distance_ratio:.3f})")
+                # Threshold: consider a frame "close enough" to track RMS if within 50% of overall RMS
+                threshold_multiplier = 0.5
+                track_start_coarse = 0
 
-                # If this frame is within threshold of the track RMS, we found the start
-                if distance_ratio <= threshold_multiplier:
-                    track_start_coarse = i / sample_rate
-                    self.log(f"  → Coarse start found at {track_start_coarse:.2f}s")
-                    break
+                coarse_starts = range(0, total_samples, coarse_samples)[:len(coarse_rms)]
 
-            # Phase 2: Fine-tune by analyzing in 0.1 second frames starting from coarse position
-            fine_frame_size = 0.1  # seconds
-            fine_samples = int(fine_frame_size * sample_rate)
+                found = self.scan_frames(coarse_rms, coarse_starts, overall_rms,
+                                         threshold_multiplier, sample_rate, settings.verbose)
+                if found is not None:
+                    track_start_coarse = coarse_starts[found]
+                    self.log(f"  → Coarse start found at {track_start_coarse / sample_rate:.2f}s")
 
-            self.log(f"  Phase 2: Fine-tuning in {fine_frame_size}s frames...")
+                # Phase 2: Fine-tune by analyzing in 0.1 second frames starting from coarse position
+                fine_frame_size = 0.1  # seconds
+                fine_samples = int(fine_frame_size * sample_rate)
 
-            # Start from a bit before the coarse position to catch the exact start
-            start_sample = max(0, int(track_start_coarse * sample_rate) - coarse_samples)
-            track_start_fine = track_start_coarse
+                self.log(f"  Phase 2: Fine-tuning in {fine_frame_size}s frames...")
 
-            for i in range(start_sample, min(start_sample + coarse_samples * 2, len(audio)), fine_samples):
-                frame = audio[i:i + fine_samples]
-                if len(frame) < fine_samples * 0.5:  # Skip if frame is too small
-                    break
+                # Start from a bit before the coarse position to catch the exact start
+                start_sample = max(0, track_start_coarse - coarse_samples)
+                track_start_fine = track_start_coarse / sample_rate
 
-                frame_rms = np.sqrt(np.mean(frame ** 2))
-                frame_db = 20 * np.log10(frame_rms + 1e-10)
-
-                # Calculate how close this frame is to the overall track RMS
-                distance_to_track = abs(frame_rms - overall_rms)
-                distance_ratio = distance_to_track / overall_rms
-
-                time_pos = i / sample_rate
-                self.log(f"    Frame at {time_pos:.2f}s: {frame_db:.2f} dB (distance ratio: {distance_ratio:.3f})")
-
-                # If this frame is within threshold of the track RMS, we found the start
-                if distance_ratio <= threshold_multiplier:
-                    track_start_fine = i / sample_rate
+                starts = range(start_sample, min(start_sample + coarse_samples * 2, total_samples), fine_samples)
+                rms = frame_rms(read_mono(start_sample, len(starts) * fine_samples), 0,
+                                len(starts), fine_samples)
+                found = self.scan_frames(rms, starts, overall_rms, threshold_multiplier, sample_rate,
+                                         settings.verbose)
+                if found is not None:
+                    track_start_fine = starts[found] / sample_rate
                     self.log(f"  → Fine start found at {track_start_fine:.2f}s")
-                    break
 
-            track_start = track_start_fine
+                track_start = track_start_fine
 
-            # For the end, do the same thing but working backwards
-            self.log(f"  Phase 3: Finding track end (analyzing from end)...")
+                # For the end, do the same thing but working backwards
+                self.log(f"  Phase 3: Finding track end (analyzing from end)...")
 
-            # Coarse pass from the end
-            track_end_coarse = total_length
+                # Coarse pass from the end, over frames that line up with the end of the file
+                track_end_coarse = total_samples
 
-            for i in range(len(audio) - coarse_samples, 0, -coarse_samples):
-                frame = audio[i:i + coarse_samples]
-                if len(frame) < coarse_samples * 0.5:
-                    break
+                # Like the original backward scan, stop short of a frame at sample 0
+                end_starts = range(total_samples % coarse_samples or coarse_samples,
+                                   total_samples - coarse_samples + 1, coarse_samples)
+                end_coarse_rms = end_coarse_rms[len(end_coarse_rms) - len(end_starts):]
+                found = self.scan_frames(end_coarse_rms[::-1], end_starts[::-1], overall_rms,
+                                         threshold_multiplier, sample_rate, settings.verbose)
+                if found is not None:
+                    track_end_coarse = end_starts[::-1][found] + coarse_samples
+                    self.log(f"  → Coarse end found at {track_end_coarse / sample_rate:.2f}s")
 
-                frame_rms = np.sqrt(np.mean(frame ** 2))
-                frame_db = 20 * np.log10(frame_rms + 1e-10)
+                # Fine-tune the end
+                self.log(f"  Phase 4: Fine-tuning track end...")
 
-                distance_to_track = abs(frame_rms - overall_rms)
-                distance_ratio = distance_to_track / overall_rms
+                end_sample = min(total_samples, track_end_coarse + coarse_samples)
+                track_end_fine = track_end_coarse / sample_rate
 
-                time_pos = i / sample_rate
-                self.log(f"    Frame at {time_pos:.2f}s: {frame_db:.2f} dB (distance ratio: {distance_ratio:.3f})")
+                starts = range(end_sample - fine_samples, max(end_sample - coarse_samples * 2, 0), -fine_samples)
+                if len(starts) > 0:
+                    # The same block of audio as a forward scan, read in reverse
+                    rms = frame_rms(read_mono(starts[-1], len(starts) * fine_samples), 0,
+                                    len(starts), fine_samples)[::-1]
+                    found = self.scan_frames(rms, starts, overall_rms, threshold_multiplier, sample_rate,
+                                         settings.verbose)
+                    if found is not None:
+                        track_end_fine = (starts[found] + fine_samples) / sample_rate
+                        self.log(f"  → Fine end found at {track_end_fine:.2f}s")
 
-                # If this frame is within threshold of the track RMS, we found the end
-                if distance_ratio <= threshold_multiplier:
-                    track_end_coarse = (i + coarse_samples) / sample_rate
-                    self.log(f"  → Coarse end found at {track_end_coarse:.2f}s")
-                    break
+                track_end = track_end_fine
 
-            # Fine-tune the end
-            self.log(f"  Phase 4: Fine-tuning track end...")
+                self.log(f"  ✓ Final result: Start={track_start:.2f}s, End={track_end:.2f}s")
 
-            end_sample = min(len(audio), int(track_end_coarse * sample_rate) + coarse_samples)
-            track_end_fine = track_end_coarse
+                return track_start, track_end, total_length
 
-            for i in range(end_sample - fine_samples, max(end_sample - coarse_samples * 2, 0), -fine_samples):
-                frame = audio[i:i + fine_samples]
-                if len(frame) < fine_samples * 0.5:
-                    break
+        except Exception as e:
+            self.log(f"Error detecting silence in {file_path}: {str(e)}")
+            self.log(traceback.format_exc())
+            return None, None, 0
+    
+    def detect_silence_ffmpeg(self, file_path: str,
+                              settings: TrimSettings) -> Tuple[Optional[float], Optional[float], float]:
+        """
+        Detect leading and trailing silence with FFmpeg's silencedetect filter, which
+        decodes and measures the file in a single FFmpeg run.
+        Falls back to the RMS analysis if FFmpeg fails.
+        Returns: (start_time, end_time, total_duration)
+        """
+        self.log(f"  Running FFmpeg silencedetect...")
+        cmd = [
+            settings.ffmpeg, '-nostdin', '-hide_banner', '-nostats', '-i', file_path,
+            '-af', f'silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_DURATION}',
+            '-f', 'null', '-'
+        ]
 
-                frame_rms = np.sqrt(np.mean(frame ** 2))
-                frame_db = 20 * np.log10(frame_rms + 1e-10)
+        # Read stderr as it is produced, keeping only the first and the latest silence;
+        # a silence still running at the end of the file has no silence_end
+        duration_match = None
+        first_silence = None
+        last_silence = None
+        try:
+            with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as proc:
+                for line in proc.stderr:
+                    marker = SILENCE_MARKER_RE.search(line)
+                    if marker is None:
+                        if duration_match is None:
+                            duration_match = DURATION_RE.search(line)
+                        continue
 
-                distance_to_track = abs(frame_rms - overall_rms)
-                distance_ratio = distance_to_track / overall_rms
+                    kind, value = marker.groups()
+                    if kind == b'start':
+                        last_silence = [max(float(value), 0.0), None]
+                        if first_silence is None:
+                            first_silence = last_silence
+                    elif last_silence is not None:
+                        last_silence[1] = float(value)
+        except OSError as e:
+            self.log(f"  FFmpeg silencedetect failed ({e}), using RMS analysis...")
+            return self.detect_silence(file_path, settings)
 
-                time_pos = i / sample_rate
-                self.log(f"    Frame at {time_pos:.2f}s: {frame_db:.2f} dB (distance ratio: {distance_ratio:.3f})")
+        if proc.returncode != 0 or duration_match is None:
+            self.log(f"  FFmpeg silencedetect failed, using RMS analysis...")
+            return self.detect_silence(file_path, settings)
 
-                # If this frame is within threshold of the track RMS, we found the end
-                if distance_ratio <= threshold_multiplier:
-                    track_end_fine = (i + fine_samples) / sample_rate
-                    self.log(f"  → Fine end found at {track_end_fine:.2f}s")
-                    break
+        hours, minutes, seconds = duration_match.groups()
+        total_length = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        self.log(f"  Duration: {total_length:.2f}s")
 
-            track_end = track_end_fine
+        track_start = 0.0
+        track_end = total_length
+        if first_silence is not None and first_silence[0] <= SILENCE_EDGE_TOLERANCE:
+            track_start = total_length if first_silence[1] is None else first_silence[1]
+            self.log(f"  → Leading silence ends at {track_start:.2f}s")
+        if last_silence is not None and (last_silence[1] is None or
+                                         last_silence[1] >= total_length - SILENCE_EDGE_TOLERANCE):
+            track_end = last_silence[0]
+            self.log(f"  → Trailing silence starts at {track_end:.2f}s")
 
-            self.log(f"  ✓ Final result: Start={track_start:.2f}s, End={track_end:.2f}s")
+        self.log(f"  ✓ Final result: Start={track_start:.2f}s, End={track_end:.2f}s")
 
-            return track_start, track_end, total_length
+        return track_start, track_end, total_length
 
-        except Exception as e:
-            self.log(f"Error detecting silence in {file_path}: {str(e)}")
-            self.log(traceback.format_exc())
-            return None, None, 0
-    
-    def get_output_codec(self, output_ext: str) -> list:
+    def get_output_codec(self, output_ext: str, normalize: bool) -> list:
         """Get the appropriate ffmpeg codec settings for the output format."""
         # If normalizing, we can't use codec copy - must re-encode
-        if self.enable_normalization.get():
+        if normalize:
             if output_ext == '.mp3':
                 return ['-acodec', 'libmp3lame', '-b:a', '320k']
             elif output_ext == '.wav':
@@ -470,23 +714,31 @@ class AudioSilenceTrimmer:
             else:
                 return ['-acodec', 'copy']  # Copy codec for same format
     
-    def process_file(self, file_path: Path, output_dir: Path, output_ext: str):
-        """Process a single audio file."""
+    def plan_file(self, file_path: Path, input_dir: Path, output_dir: Path, output_ext: str,
+                  known_dirs: set, settings: TrimSettings) -> Optional[TrimJob]:
+        """
+        Detect the silence in a file and plan the ffmpeg cut that removes it.
+
+        `known_dirs` holds the output subdirectories already created in this run.
+        """
         try:
             self.log(f"\nProcessing: {file_path.name}")
             
             # Detect silence
-            track_start, track_end, total_length = self.detect_silence(str(file_path))
+            if settings.detection_method == "ffmpeg":
+                track_start, track_end, total_length = self.detect_silence_ffmpeg(str(file_path), settings)
+            else:
+                track_start, track_end, total_length = self.detect_silence(str(file_path), settings)
             
             if track_start is None or track_end is None:
                 self.log(f"  Skipped: Could not detect silence")
-                return
+                return None
             
             duration = track_end - track_start
             
             if duration <= 0:
                 self.log(f"  Skipped: Invalid duration ({duration}s)")
-                return
+                return None
             
             self.log(f"  Total length: {total_length:.2f}s")
 
@@ -506,60 +758,83 @@ class AudioSilenceTrimmer:
             if output_ext == "original":
                 output_ext = file_path.suffix
             
-            if self.overwrite_originals.get():
+            if settings.overwrite:
                 # Create a truly temporary file in the same directory
                 temp_name = f"{file_path.stem}_{uuid.uuid4().hex[:8]}_temp{output_ext}"
                 output_path = file_path.parent / temp_name
             else:
                 # Preserve directory structure in output folder
                 try:
-                    rel_path = file_path.parent.relative_to(Path(self.input_folder.get()))
+                    rel_path = file_path.parent.relative_to(input_dir)
                 except ValueError:
                     # If relative path fails, just use the filename
                     rel_path = Path(".")
                 output_subdir = output_dir / rel_path
-                try:
-                    output_subdir.mkdir(parents=True, exist_ok=True)
-                except Exception as e:
-                    self.log(f"  ✗ Error creating output subdirectory: {str(e)}")
-                    return
+                if output_subdir not in known_dirs:
+                    try:
+                        output_subdir.mkdir(parents=True, exist_ok=True)
+                    except Exception as e:
+                        self.log(f"  ✗ Error creating output subdirectory: {str(e)}")
+                        return None
+                    known_dirs.add(output_subdir)
                 output_path = output_subdir / f"{file_path.stem}_trimmed{output_ext}"
             
-            # Build ffmpeg command
-            ffmpeg = self.ffmpeg_path.get()
-            codec_settings = self.get_output_codec(output_ext)
+            # Build ffmpeg options
+            codec_settings = self.get_output_codec(output_ext, settings.normalize)
             
             # Build filter chain
             filters = []
             
             # Add normalization if enabled
-            if self.enable_normalization.get():
-                try:
-                    target_db = float(self.normalization_level.get())
-                    # Use volume filter to normalize to peak level
-                    # First pass would ideally measure, but for simplicity we'll use a two-pass approach
-                    # For real-time we'll use a simpler loudnorm filter
-                    filters.append(f"loudnorm=I=-16:TP={target_db}:LRA=11")
-                    self.log(f"  Normalizing to {target_db} dB")
-                except ValueError:
-                    self.log(f"  Warning: Invalid normalization level, skipping normalization")
+            if settings.normalize:
+                # Use volume filter to normalize to peak level
+                # First pass would ideally measure, but for simplicity we'll use a two-pass approach
+                # For real-time we'll use a simpler loudnorm filter
+                filters.append(f"loudnorm=I=-16:TP={settings.target_db}:LRA=11")
+                self.log(f"  Normalizing to {settings.target_db} dB")
             
-            # Construct command
-            cmd = [
-                ffmpeg, '-i', str(file_path),
-                '-ss', str(track_start),
-                '-t', str(duration)
-            ]
-            
-            # Add filters if any
-            if filters:
-                cmd.extend(['-af', ','.join(filters)])
-            
-            # Add codec settings
-            cmd.extend(codec_settings)
+            # Construct ffmpeg options
+            if not filters and output_ext == file_path.suffix:
+                if track_start == 0 and track_end == total_length:
+                    # Nothing to trim, convert or normalize: the output would be the input
+                    if settings.overwrite:
+                        self.log(f"  Nothing to change, original left as is")
+                    else:
+                        shutil.copy2(file_path, output_path)
+                        self.log(f"  ✓ Copied to: {output_path}")
+                    return None
+
+                # Same format with nothing to filter: seek on the input and copy the
+                # packets across, so nothing is decoded or re-encoded
+                self.log(f"  Copying audio stream (no re-encoding)")
+                input_args = ('-ss', str(track_start))
+                output_args = ('-t', str(duration),
+                               '-c', 'copy', '-avoid_negative_ts', 'make_zero')
+            else:
+                # Seek on the output for a sample-accurate cut while re-encoding
+                input_args = ()
+                output_args = ['-ss', str(track_start), '-t', str(duration)]
+
+                # Add filters if any
+                if filters:
+                    output_args.extend(['-af', ','.join(filters)])
 
-            # Add output file with overwrite flag
-            cmd.extend(['-y', str(output_path)])
+                # Add codec settings
+                output_args = tuple(output_args + codec_settings)
+
+            return TrimJob(file_path, output_path, input_args, output_args)
+
+        except Exception as e:
+            self.log(f"  ✗ Error processing file: {str(e)}")
+            self.log(f"  {traceback.format_exc()}")
+            return None
+
+    def trim_file(self, job: TrimJob, settings: TrimSettings):
+        """Cut one planned file with its own ffmpeg process."""
+        try:
+            self.log(f"\nTrimming: {job.file_path.name}")
+
+            cmd = trim_command(settings.ffmpeg, [job])
             
             # Log the command for debugging
             self.log(f"  Running: {' '.join(cmd)}")
@@ -568,20 +843,20 @@ class AudioSilenceTrimmer:
             result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
             
             if result.returncode == 0:
-                self.log(f"  ✓ Saved to: {output_path}")
+                self.log(f"  ✓ Saved to: {job.output_path}")
                 
                 # If overwriting, replace original file
-                if self.overwrite_originals.get():
+                if settings.overwrite:
                     try:
                         # Delete original and rename temp file
-                        file_path.unlink()
-                        output_path.rename(file_path)
+                        job.file_path.unlink()
+                        job.output_path.rename(job.file_path)
                         self.log(f"  ✓ Replaced original file")
                     except Exception as e:
                         self.log(f"  ✗ Error replacing original: {str(e)}")
                         # Clean up temp file if rename failed
-                        if output_path.exists():
-                            output_path.unlink()
+                        if job.output_path.exists():
+                            job.output_path.unlink()
             else:
                 self.log(f"  ✗ FFmpeg error:")
                 # Show last few lines of error
@@ -593,16 +868,64 @@ class AudioSilenceTrimmer:
         except Exception as e:
             self.log(f"  ✗ Error processing file: {str(e)}")
             self.log(f"  {traceback.format_exc()}")
-    
+
+    def trim_batch(self, jobs: List[TrimJob], settings: TrimSettings):
+        """
+        Cut several planned files with a single ffmpeg process.
+
+        Every file is an input of the same command and mapped to its own output,
+        which saves starting ffmpeg and its codecs once per file. If the batch
+        fails, its files are cut one at a time so the bad one is reported.
+        """
+        if len(jobs) == 1:
+            self.trim_file(jobs[0], settings)
+            return
+
+        cmd = trim_command(settings.ffmpeg, jobs)
+
+        try:
+            returncode = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL).returncode
+        except Exception:
+            returncode = None
+
+        if returncode == 0:
+            self.log("\n".join(f"\nTrimming: {job.file_path.name}\n  ✓ Saved to: {job.output_path}"
+                               for job in jobs))
+            return
+
+        self.log(f"\nBatch of {len(jobs)} files failed, trimming them one at a time")
+        for job in jobs:
+            self.trim_file(job, settings)
+
+    def _run_logged(self, func, *args) -> tuple:
+        """Call func on a worker thread, returning its result and its log messages."""
+        self._file_log.lines = []
+        try:
+            return func(*args), self._file_log.lines
+        finally:
+            del self._file_log.lines
+
     def process_files(self):
         """Main processing function."""
         try:
+            # Read the settings once, the workers below never touch Tk
+            normalize = self.enable_normalization.get()
+            settings = TrimSettings(
+                ffmpeg=self.ffmpeg_path.get(),
+                detection_method=self.detection_method.get(),
+                verbose=self.verbose_logging.get(),
+                overwrite=self.overwrite_originals.get(),
+                normalize=normalize,
+                target_db=float(self.normalization_level.get()) if normalize else -1.0,
+            )
+
             input_dir = Path(self.input_folder.get())
             if not input_dir.exists():
                 messagebox.showerror("Error", "Input folder does not exist!")
                 return
             
-            if not self.overwrite_originals.get():
+            if not settings.overwrite:
                 output_folder_str = self.output_folder.get().strip()
                 if not output_folder_str:
                     messagebox.showerror("Error", "Output folder path is empty!")
@@ -620,7 +943,7 @@ class AudioSilenceTrimmer:
             
             # Check ffmpeg
             try:
-                subprocess.run([self.ffmpeg_path.get(), '-version'], 
+                subprocess.run([settings.ffmpeg, '-version'], 
                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
             except Exception:
                 messagebox.showerror("Error", 
@@ -646,10 +969,46 @@ class AudioSilenceTrimmer:
             self.log(f"Found {len(files)} file(s) to process.\n")
             self.log("=" * 70)
             
-            # Process each file
-            for i, file_path in enumerate(files, 1):
-                self.log(f"\n[{i}/{len(files)}]")
-                self.process_file(file_path, output_dir, output_ext)
+            # Files are independent and the heavy lifting happens in NumPy, soundfile
+            # and FFmpeg, which don't hold the GIL, so threads run them in parallel
+            max_workers = min(os.cpu_count() or 1, len(files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Detect the silence in every file and plan its cut...
+                known_dirs = set()
+                futures = {
+                    executor.submit(self._run_logged, self.plan_file, file_path, input_dir,
+                                    output_dir, output_ext, known_dirs, settings): file_path
+                    for file_path in files
+                }
+                jobs = []
+                for i, future in enumerate(as_completed(futures), 1):
+                    self.log(f"\n[{i}/{len(files)}]")
+                    try:
+                        job, log_lines = future.result()
+                    except Exception as e:
+                        job, log_lines = None, [f"\nProcessing: {futures[future].name}",
+                                                f"  ✗ Error processing file: {str(e)}"]
+                    for line in log_lines:
+                        self.log(line)
+                    if job is not None:
+                        jobs.append(job)
+
+                # ...then make the cuts, several files per ffmpeg process. Overwriting
+                # swaps each original for its temp file, so keep one process per file there
+                if settings.overwrite:
+                    batch_size = 1
+                else:
+                    batch_size = max(1, min(BATCH_SIZE, -(-len(jobs) // max_workers)))
+                batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+                if batches:
+                    self.log("\n" + "=" * 70)
+                futures = [executor.submit(self._run_logged, self.trim_batch, batch, settings)
+                           for batch in batches]
+                for future in as_completed(futures):
+                    _, log_lines = future.result()
+                    for line in log_lines:
+                        self.log(line)
             
             self.log("\n" + "=" * 70)
             self.log(f"\n✓ Processing complete! Processed {len(files)} file(s).")